@@ -0,0 +1,16 @@
+"""Module providing the default HTTP client used by ThemoClient."""
+
+import httpx
+
+
+def create_client() -> httpx.AsyncClient:
+    """Create an HTTP client with a tuned connection pool."""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=20,
+            max_keepalive_connections=10,
+            keepalive_expiry=60.0,
+        ),
+        timeout=httpx.Timeout(30.0, connect=10.0),
+    )
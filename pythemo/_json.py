@@ -0,0 +1,25 @@
+"""Module providing JSON helpers backed by orjson when it is installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes."""
+        return orjson.dumps(obj)
+
+else:
+    loads = json.loads
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode()
@@ -0,0 +1,61 @@
+"""Module providing a process-local TTL cache for Themo access tokens."""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+
+import httpx
+
+HARD_TTL = 3 * 60 * 60
+IDLE_TTL = 60 * 60
+MAX_ENTRIES = 128
+
+# Maps a credentials hash to (token, expires_at, last_used).
+_cache: OrderedDict[str, tuple[str, float, float]] = OrderedDict()
+
+
+def cache_key(username: str, password: str) -> str:
+    """Return the cache key for a username and password pair."""
+    return hashlib.sha256(json.dumps([username, password]).encode()).hexdigest()
+
+
+def get_cached_token(key: str) -> str | None:
+    """Return the cached token for ``key`` if it has not expired."""
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+
+    token, expires_at, last_used = entry
+    now = time.monotonic()
+    if now >= expires_at or now - last_used >= IDLE_TTL:
+        del _cache[key]
+        return None
+
+    _cache[key] = (token, expires_at, now)
+    _cache.move_to_end(key)
+    return token
+
+
+def store_token(key: str, token: str, ttl: float | None = None) -> None:
+    """Cache ``token`` for ``key`` for at most ``ttl`` seconds."""
+    ttl = HARD_TTL if ttl is None else min(ttl, HARD_TTL)
+    now = time.monotonic()
+    _cache[key] = (token, now + ttl, now)
+    _cache.move_to_end(key)
+    while len(_cache) > MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+
+def invalidate_token(token: str) -> None:
+    """Remove every cache entry holding ``token``."""
+    for key in [key for key, entry in _cache.items() if entry[0] == token]:
+        del _cache[key]
+
+
+def invalidate_if_unauthorized(response: httpx.Response) -> None:
+    """Remove the token used for ``response`` if the API rejected it."""
+    if response.status_code != 401:
+        return
+    authorization = response.request.headers.get("Authorization", "")
+    invalidate_token(authorization.removeprefix("Bearer "))
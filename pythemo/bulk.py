@@ -0,0 +1,10 @@
+"""Module providing helpers that operate on many Themo devices at once."""
+
+import asyncio
+
+from .models import Device
+
+
+async def update_all(devices: list[Device]) -> None:
+    """Update the state of all given devices concurrently."""
+    await asyncio.gather(*(device.update_state() for device in devices))
@@ -1,8 +1,19 @@
 """Provides a client for interacting with the Themo API."""
 
+import time
+
 import httpx
 
-from .constants import BASE_URL
+from ._http import create_client
+from ._json import loads
+from ._token_cache import (
+    cache_key,
+    get_cached_token,
+    invalidate_if_unauthorized,
+    store_token,
+)
+from .bulk import update_all
+from .constants import BASE_URL, DEVICES_TTL
 from .models import Device
 
 
@@ -40,16 +51,50 @@ class ThemoClient:
 
         :param username: The username for authentication.
         :param password: The password for authentication.
-        :param client: An optional HTTP client instance.
+        :param client: An optional HTTP client instance. If omitted, a client
+            with a tuned connection pool is created. Pass one client to several
+            ThemoClient instances to share its connection pool; such a client
+            is left open by close() and must be closed by the caller.
         """
         self.username = username
         self.password = password
         self.token = None
         self.client_id = None
-        self._client = client or httpx.AsyncClient()
+        self._owns_client = client is None
+        self._client = client or create_client()
+        self._headers: dict[str, str] = {}
+        self._devices: list[Device] | None = None
+        self._devices_ts: float | None = None
+
+    async def __aenter__(self) -> "ThemoClient":
+        """Enter the async context and return the client."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Exit the async context and close the HTTP client if this instance owns it."""
+        await self.close()
 
     async def authenticate(self):
-        """Authenticate the client and obtain an access token."""
+        """Authenticate the client and obtain an access token.
+
+        A token cached by an earlier authentication with the same credentials
+        is reused until it expires or the API rejects it.
+        """
+        key = cache_key(self.username, self.password)
+        self.token = get_cached_token(key)
+        if self.token is None:
+            self.token = await self._request_token(key)
+
+        self._headers.update(
+            {
+                "Authorization": f"Bearer {self.token}",
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            }
+        )
+
+    async def _request_token(self, key: str) -> str:
+        """Request a new access token and cache it under the given key."""
         try:
             response = await self._client.post(
                 f"{BASE_URL}/token",
@@ -62,48 +107,83 @@ class ThemoClient:
                     "password": self.password,
                 },
             )
-            data = response.json()
+            data = loads(response.content)
 
             if response.status_code != 200:
                 raise ThemoAuthenticationError(
                     data.get("error_description", "Unknown error"),
                     response,
                 )
-
-            self.token = data["access_token"]
-
-            self._client.headers.update(
-                {
-                    "Authorization": f"Bearer {self.token}",
-                    "Content-Type": "application/json",
-                    "Accept": "application/json",
-                }
-            )
         except httpx.RequestError as e:
             raise ThemoConnectionError("Failed to connect to Themo API") from e
 
+        token = data["access_token"]
+        store_token(key, token, data.get("expires_in"))
+        return token
+
     async def get_client_id(self):
-        """Retrieve and set the client ID."""
-        response = await self._client.get(f"{BASE_URL}/api/clients/me")
-        data = response.json()
-        self.client_id = data.get("ID")
+        """Retrieve and set the client ID.
+
+        :raises httpx.HTTPStatusError: If the API returns an error status, in
+            which case ``client_id`` is left unchanged.
+        """
+        response = await self._client.get(
+            f"{BASE_URL}/api/clients/me", headers=self._headers
+        )
+        invalidate_if_unauthorized(response)
+        response.raise_for_status()
+        data = loads(response.content)
+        self.client_id = data["ID"]
 
     async def get_all_devices(self):
         """Retrieve all devices associated with the authenticated client.
 
+        The device list is cached for ``DEVICES_TTL`` seconds and refetched
+        by the first call after it expires.
+
         :return: A list of Device instances.
         """
+        if (
+            self._devices is not None
+            and time.monotonic() - self._devices_ts < DEVICES_TTL
+        ):
+            return list(self._devices)
+
         response = await self._client.get(
             f"{BASE_URL}/Api/Devices",
             params={"pageSize": -1},
+            headers=self._headers,
         )
-        devices_data = response.json()
+        invalidate_if_unauthorized(response)
+        response.raise_for_status()
+        devices_data = loads(response.content)
 
-        return [
-            Device(id=item["ID"], client=self._client)
+        self._devices = [
+            Device(id=item["ID"], client=self._client, headers=self._headers)
             for item in devices_data["Devices"]
         ]
+        self._devices_ts = time.monotonic()
+        return list(self._devices)
+
+    def invalidate_devices(self):
+        """Discard the cached device list so the next fetch hits the API."""
+        self._devices = None
+        self._devices_ts = None
+
+    async def get_all_devices_hydrated(self):
+        """Retrieve all devices and fetch their state and schedules concurrently.
+
+        :return: A list of Device instances with their state populated.
+        """
+        devices = await self.get_all_devices()
+        await update_all(devices)
+        return devices
 
     async def close(self):
-        """Close the client session."""
-        await self._client.aclose()
+        """Close the client session.
+
+        Only an HTTP client created by this instance is closed; a client passed
+        in by the caller is left open.
+        """
+        if self._owns_client:
+            await self._client.aclose()
@@ -1 +1,4 @@
 BASE_URL = "https://app.themo.io"
+API_VERSION = "2.0"
+
+DEVICES_TTL = 300
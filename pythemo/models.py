@@ -1,16 +1,49 @@
 """Module containing the Device class to represent a Themo device and manage its state. and attributes."""
 
-import json
+import asyncio
 from typing import Any
 
 import httpx
 
-from .constants import BASE_URL
+from ._json import JSONDecodeError, dumps, loads
+from ._token_cache import invalidate_if_unauthorized
+from .constants import API_VERSION, BASE_URL
+
+_JSON_CONTENT_TYPE: dict[str, str] = {"Content-Type": "application/json"}
+_API_VERSION_PARAMS: dict[str, str] = {"api-version": API_VERSION}
+_MISSING = object()
+_VALID_MODES: frozenset[str] = frozenset({"Manual", "Off", "SLS"})
 
 
 class Device:
     """A class to represent a Themo device and manage its state and attributes."""
 
+    __slots__ = (
+        "id",
+        "_client",
+        "_headers",
+        "_device_url",
+        "_state_url",
+        "_schedules_url",
+        "_switch_url",
+        "_msg_lights_url",
+        "_msg_temp_url",
+        "_msg_mode_url",
+        "name",
+        "device_id",
+        "active_schedule",
+        "available_schedules",
+        "floor_temperature",
+        "info",
+        "lights",
+        "manual_temperature",
+        "max_power",
+        "mode",
+        "power",
+        "room_temperature",
+        "sw_version",
+    )
+
     STATE_ATTRIBUTES: dict[str, str] = {
         "floor_temperature": "FloorT",
         "info": "Info",
@@ -22,11 +55,27 @@ class Device:
         "room_temperature": "RT",
         "sw_version": "SW",
     }
+    _STATE_ITEMS: tuple[tuple[str, str], ...] = tuple(STATE_ATTRIBUTES.items())
+
+    _LIGHTS_ON: bytes = dumps({"CLights": "1"})
+    _LIGHTS_OFF: bytes = dumps({"CLights": "0"})
+    _MODE_BYTES: dict[str, bytes] = {
+        mode: dumps({"CMode": mode}) for mode in _VALID_MODES
+    }
 
-    def __init__(self, id: str, client) -> None:
+    def __init__(self, id: str, client, headers: dict[str, str] | None = None) -> None:
         """Initialize a Device instance."""
         self.id: str = id
         self._client = client
+        self._headers: dict[str, str] = {} if headers is None else headers
+
+        self._device_url: str = f"{BASE_URL}/api/devices/{id}"
+        self._state_url: str = f"{self._device_url}/state"
+        self._schedules_url: str = f"{self._device_url}/schedules/temperature"
+        self._switch_url: str = f"{self._schedules_url}/switch"
+        self._msg_lights_url: str = f"{BASE_URL}/Api/Devices/{id}/Message/Lights"
+        self._msg_temp_url: str = f"{BASE_URL}/Api/Devices/{id}/Message/Temperature"
+        self._msg_mode_url: str = f"{self._device_url}/message/mode"
 
         self.name: str | None = None
         self.device_id: str | None = None
@@ -42,27 +91,37 @@ class Device:
         self.mode: str | None = None
         self.power: float | None = None
         self.room_temperature: float | None = None
+        self.sw_version: str | None = None
 
     def __repr__(self) -> str:
         """Return a string representation of the Device instance."""
         return f"<Themo(id={self.id!r}, name={self.name!r}>"
 
     async def _api_request(
-        self, method: str, endpoint: str, **kwargs: Any
+        self, method: str, url: str, **kwargs: Any
     ) -> dict[str, Any]:
         """Make API requests."""
-        url: str = f"{BASE_URL}/{endpoint}"
-        response: httpx.Response = await getattr(self._client, method)(url, **kwargs)
+        headers: dict[str, str] = self._headers
+        if "content" in kwargs:
+            headers = {**headers, **_JSON_CONTENT_TYPE}
+        if "headers" in kwargs:
+            headers = {**headers, **kwargs.pop("headers")}
+        response: httpx.Response = await self._client.request(
+            method, url, headers=headers, **kwargs
+        )
+        invalidate_if_unauthorized(response)
         response.raise_for_status()
+        if not response.content:
+            return {}
         try:
-            return response.json()
-        except json.JSONDecodeError:
-            pass
+            return loads(response.content)
+        except JSONDecodeError:
+            return {}
 
     def _update_attributes(self, data: dict[str, Any]) -> None:
         """Update device attributes."""
-        self.name = data.get("DeviceName")
-        self.device_id = data.get("DeviceID")
+        self.name = data["DeviceName"]
+        self.device_id = data["DeviceID"]
 
         state_data: dict[str, Any] = data.get("State", {})
         self._update_state_attributes(state_data)
@@ -70,10 +129,10 @@ class Device:
     async def update_state(self):
         """Primary method to update the device state."""
         if not self.is_initialized():
-            await self.fetch_initial_data()
+            fetch_state = self.fetch_initial_data()
         else:
-            await self.fetch_current_state()
-        await self.fetch_schedules()
+            fetch_state = self.fetch_current_state()
+        await asyncio.gather(fetch_state, self.fetch_schedules())
 
     def is_initialized(self) -> bool:
         """Determine if the device has been initialized."""
@@ -96,80 +155,65 @@ class Device:
 
     def _update_schedules(self, schedules_data: list[dict[str, Any]]) -> None:
         """Update device schedules based on the provided data."""
-        self.available_schedules = [schedule["Name"] for schedule in schedules_data]
+        names: list[str] = []
+        active: str | None = None
         for schedule in schedules_data:
+            names.append(schedule["Name"])
             if schedule["Active"]:
-                self.active_schedule = schedule["Name"]
+                active = schedule["Name"]
+        self.available_schedules = names
+        self.active_schedule = active
 
     async def _get_device_data(self) -> dict[str, Any]:
-        return await self._api_request("get", f"api/devices/{self.id}")
+        return await self._api_request("GET", self._device_url)
 
     async def _get_state_data(self) -> dict[str, Any]:
-        return await self._api_request("get", f"api/devices/{self.id}/state")
+        return await self._api_request("GET", self._state_url)
 
     async def _get_schedules_data(self) -> list[dict[str, Any]]:
-        params = {"api-version": "2.0"}
         return await self._api_request(
-            "get", f"api/devices/{self.id}/schedules/temperature", params=params
+            "GET", self._schedules_url, params=_API_VERSION_PARAMS
         )
 
     def _update_state_attributes(self, state_data):
-        for attr, key in self.STATE_ATTRIBUTES.items():
-            value = state_data.get(key)
-            if attr == "lights":
-                value = bool(value)
-            setattr(self, attr, value)
+        """Update state attributes present in the data, keeping the others."""
+        for attr, key in self._STATE_ITEMS:
+            value = state_data.get(key, _MISSING)
+            if value is not _MISSING:
+                setattr(self, attr, value)
+        lights = state_data.get("Lights")
+        if lights is not None:
+            self.lights = bool(lights)
 
     async def set_lights(self, state: bool) -> None:
         """Set the lights state."""
-        payload: dict[str, str] = {"CLights": "1" if state else "0"}
-        await self._api_request(
-            "post", f"Api/Devices/{self.id}/Message/Lights", json=payload
-        )
+        body: bytes = self._LIGHTS_ON if state else self._LIGHTS_OFF
+        await self._api_request("POST", self._msg_lights_url, content=body)
         self.lights = state
 
     async def set_manual_temperature(self, temperature: int) -> None:
         """Set the lights state."""
-        payload: dict[str, str] = {"CMT": str(temperature)}
-        await self._api_request(
-            "post", f"Api/Devices/{self.id}/Message/Temperature", json=payload
-        )
+        body: bytes = dumps({"CMT": str(temperature)})
+        await self._api_request("POST", self._msg_temp_url, content=body)
         self.manual_temperature = temperature
 
-    async def update_schedules(self) -> None:
-        """Fetch and update the device schedules."""
-        params: dict[str, str] = {"api-version": "2.0"}
-        data: list[dict[str, Any]] = await self._api_request(
-            "get", f"api/devices/{self.id}/schedules/temperature", params=params
-        )
-        self.available_schedules = [schedule["Name"] for schedule in data]
-        for schedule in data:
-            if schedule["Active"]:
-                self.active_schedule = schedule["Name"]
-
     async def set_active_schedule(self, schedule_name: str) -> None:
         """Switch to a different schedule."""
         if schedule_name not in self.available_schedules:
             raise ValueError(f"Invalid schedule name: {schedule_name}")
 
-        await self._api_request(
-            "put",
-            (
-                f"api/devices/{self.id}/schedules/temperature/switch?"
-                f"scheduleName={schedule_name.replace(' ', '+')}&api-version=2.0"
-            ),
-        )
+        params: dict[str, str] = {
+            "scheduleName": schedule_name,
+            "api-version": API_VERSION,
+        }
+        await self._api_request("PUT", self._switch_url, params=params)
         self.active_schedule = schedule_name
 
     async def set_mode(self, mode: str) -> None:
         """Switch to a different schedule."""
-        if mode not in ("Manual", "Off", "SLS"):
-            raise ValueError
-
-        payload: dict[str, str] = {"CMode": mode}
-        await self._api_request(
-            "post",
-            f"api/devices/{self.id}/message/mode",
-            json=payload,
-        )
+        if mode not in _VALID_MODES:
+            raise ValueError(f"Invalid mode: {mode!r}")
+
+        body: bytes = self._MODE_BYTES[mode]
+        await self._api_request("POST", self._msg_mode_url, content=body)
         self.mode = mode
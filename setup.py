@@ -1,16 +1,21 @@
+from pathlib import Path
+
 from setuptools import find_packages, setup
 
+long_description = Path(__file__).with_name("README.md").read_text(encoding="utf-8")
+
 setup(
     name="pythemo",
     version="0.2.1",
     packages=find_packages(),
     install_requires=[
-        "httpx",
+        "httpx[http2]",
+        "orjson",
     ],
     author="Your Name",
     author_email="your.email@example.com",
     description="A Python client for Themo smart thermostats",
-    long_description=open("README.md").read(),
+    long_description=long_description,
     long_description_content_type="text/markdown",
     license="MIT",
 )